@@ -6,51 +6,73 @@ Supports multiple time zones, system monitoring, and button interactions
 """
 
 import os
+import re
 import sys
+import importlib.util
 import time
 import json
+import socket
+import struct
 import threading
 import subprocess
-from datetime import datetime, timezone
-import pytz
+from datetime import datetime, timezone, timedelta
+from zoneinfo import ZoneInfo
 import signal
 import logging
 from pathlib import Path
 
-# Auto-install required packages
+# Required packages, mapped to the module each one provides
+REQUIRED_PACKAGES = {
+    'luma.oled': 'luma.oled',
+    'smbus2': 'smbus2',
+    'psutil': 'psutil',
+    'Pillow': 'PIL'
+}
+
 def install_packages():
-    """Install required packages if not available"""
-    required_packages = [
-        'luma.oled',
-        'psutil',
-        'pytz',
-        'RPi.GPIO',
-        'Pillow'
-    ]
-    
-    for package in required_packages:
+    """Install required packages that are not available"""
+    for package, module in REQUIRED_PACKAGES.items():
         try:
-            __import__(package.replace('-', '_').replace('.', '_'))
+            found = importlib.util.find_spec(module) is not None
         except ImportError:
+            found = False
+        
+        if not found:
             print(f"Installing {package}...")
             subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
 
-# Install packages first
-install_packages()
+# Only touch pip when explicitly asked to, not on every start
+if '--install-deps' in sys.argv:
+    install_packages()
 
 # Now import the packages
 try:
     from luma.core.interface.serial import i2c
-    from luma.core.render import canvas
     from luma.oled.device import ssd1306
+    from smbus2 import SMBus, I2cFunc
     from PIL import Image, ImageDraw, ImageFont
-    import RPi.GPIO as GPIO
     import psutil
 except ImportError as e:
     print(f"Failed to import required modules: {e}")
-    print("Please run: pip3 install luma.oled psutil pytz RPi.GPIO Pillow")
+    print("Please run: pip3 install luma.oled smbus2 psutil Pillow")
+    print(f"Or run: {sys.executable} {__file__} --install-deps")
     sys.exit(1)
 
+# Optional: button edges from the kernel GPIO character device, preferred over RPi.GPIO
+try:
+    import gpiod
+except ImportError:
+    gpiod = None
+
+# Optional fallback; RPi.GPIO raises RuntimeError when imported on non-Raspberry Pi boards
+try:
+    import RPi.GPIO as GPIO
+except (ImportError, RuntimeError):
+    GPIO = None
+
+# MemTotal and MemAvailable from /proc/meminfo, in kB
+MEMINFO_RE = re.compile(rb'MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)', re.S)
+
 class NanoPiOLEDMonitor:
     def __init__(self):
         self.config_file = Path.home() / '.nanopi_monitor_config.json'
@@ -70,32 +92,86 @@ class NanoPiOLEDMonitor:
         # Configuration
         self.config = self.load_config()
         
-        # Display modes
+        # Display modes, names are only used for logging
         self.display_modes = [
             'datetime',
             'system_info',
             'network_info',
             'temperature'
         ]
+        self._draw_fns = [
+            self.draw_datetime,
+            self.draw_system_info,
+            self.draw_network_info,
+            self.draw_temperature
+        ]
         self.current_mode = 0
         
+        # Set to wake the display thread for an immediate repaint
+        self._wake = threading.Event()
+        
         # GPIO setup for buttons (F1, F2, F3)
         self.button_pins = [16, 20, 21]  # Adjust based on your wiring
         self.setup_gpio()
         
         # OLED setup
+        self._last_pages = None  # Page buffers currently on the panel
         self.setup_display()
         
+        # Resolve the font once instead of on every draw.text call. This is the bitmap
+        # font (load_default() is FreeType on Pillow >= 10.1), so pasted tiles line up
+        self.font = getattr(ImageFont, 'load_default_imagefont', ImageFont.load_default)()
+        
+        # The clock is pasted from pre-rendered tiles: one per seconds value, and the
+        # "HH:MM:" prefix, which is re-rendered only when the minute changes
+        self._glyph_height = self.font.getbbox('0123456789:')[3]
+        self._sec_imgs = {'%02d' % n: self._render_glyph('%02d' % n) for n in range(60)}
+        self._sec_x = round(self.font.getlength('00:00:'))
+        self._hm_tile = (None, None)
+        
         # Time zone
-        self.timezone = pytz.timezone(self.config.get('timezone', 'UTC'))
+        self.timezone = ZoneInfo(self.config.get('timezone', 'UTC'))
+        self._tz_label = self.config.get('timezone', 'UTC').split('/')[-1]
         
         # Threading
         self.running = True
         self.display_lock = threading.Lock()
         
         # NTP sync
-        self.last_ntp_sync = 0
+        # Monotonic clock, so stepping the system time cannot skew the interval
         self.ntp_sync_interval = 3600  # 1 hour
+        self.last_ntp_sync = time.monotonic() - self.ntp_sync_interval
+        self.ntp_step_threshold = 0.5  # Only step the clock beyond this offset (s)
+        
+        # Sensors are sampled by a background thread into this snapshot, which
+        # is replaced as a whole on every update so readers never need a lock
+        self._snapshot = {}
+        self._samplers = {
+            'sys': (self.get_system_info, 2),
+            'net': (self.get_network_info, 5),
+            'temp': (self.get_temperature, 5)
+        }
+        
+        # /proc files are kept open and re-read from the start on each sample
+        self._meminfo_fd = os.open('/proc/meminfo', os.O_RDONLY)
+        self._stat_fd = os.open('/proc/stat', os.O_RDONLY)
+        self._cpu_times = self.read_cpu_times()  # Baseline for CPU usage deltas
+        
+        # Root filesystem usage moves slowly, cache it as (monotonic time, (used, total, percent))
+        self._disk_cache = (0, None)
+        self.disk_cache_ttl = 30
+        
+        # IP addresses change rarely, cache them as (monotonic time, addresses)
+        self._net_cache = (0, None)
+        self.net_cache_ttl = 30
+        
+        # Previous (timestamp, bytes_sent, bytes_recv) for traffic rates
+        self._net_io_last = None
+        
+        # Temperature sensor file, kept open for the lifetime of the monitor
+        self._temp_path = None
+        self._temp_fd = None
+        self.open_temperature_sensor()
         
         self.logger.info("NanoPi OLED Monitor initialized")
 
@@ -107,7 +183,8 @@ class NanoPiOLEDMonitor:
             'auto_brightness': True,
             'ntp_servers': ['pool.ntp.org', 'time.google.com'],
             'display_timeout': 0,  # 0 = never timeout
-            'refresh_rate': 1.0
+            'refresh_rate': 1.0,
+            'gpio_chip': '/dev/gpiochip0'
         }
         
         if self.config_file.exists():
@@ -130,6 +207,21 @@ class NanoPiOLEDMonitor:
 
     def setup_gpio(self):
         """Setup GPIO for buttons"""
+        self._gpio_lines = None
+        self._last_press = dict.fromkeys(self.button_pins, 0.0)
+        
+        if gpiod is not None:
+            try:
+                self._gpio_lines = self.request_gpio_lines()
+                self.logger.info("GPIO setup completed (libgpiod)")
+                return
+            except Exception as e:
+                self.logger.warning(f"libgpiod setup failed, falling back to RPi.GPIO: {e}")
+        
+        if GPIO is None:
+            self.logger.warning("GPIO setup skipped: neither libgpiod nor RPi.GPIO is usable")
+            return
+        
         try:
             GPIO.setmode(GPIO.BCM)
             GPIO.setwarnings(False)
@@ -146,11 +238,106 @@ class NanoPiOLEDMonitor:
         except Exception as e:
             self.logger.warning(f"GPIO setup failed: {e}")
 
-    def setup_display(self):
-        """Setup OLED display"""
+    def request_gpio_lines(self):
+        """Request the button lines for falling edge events with pull-ups"""
+        chip_path = self.config['gpio_chip']
+        consumer = 'nanopi-oled-monitor'
+        
+        if hasattr(gpiod, 'request_lines'):  # libgpiod v2
+            settings = gpiod.LineSettings(
+                edge_detection=gpiod.line.Edge.FALLING,
+                bias=gpiod.line.Bias.PULL_UP
+            )
+            return gpiod.request_lines(chip_path, consumer=consumer,
+                                       config={tuple(self.button_pins): settings})
+        
+        lines = gpiod.Chip(chip_path).get_lines(self.button_pins)
+        lines.request(consumer=consumer, type=gpiod.LINE_REQ_EV_FALLING_EDGE,
+                      flags=getattr(gpiod, 'LINE_REQ_FLAG_BIAS_PULL_UP', 0))
+        return lines
+
+    def read_gpio_events(self):
+        """Wait up to a second for button edges and return the pins that fired"""
+        lines = self._gpio_lines
+        
+        if hasattr(lines, 'wait_edge_events'):  # libgpiod v2
+            if not lines.wait_edge_events(timedelta(seconds=1)):
+                return []
+            return [event.line_offset for event in lines.read_edge_events()]
+        
+        fired = lines.event_wait(sec=1)
+        if not fired:
+            return []
+        return [line.event_read().source.offset() for line in fired]
+
+    def gpio_thread(self):
+        """Button event thread, sleeps in the kernel until an edge arrives"""
+        while self.running:
+            try:
+                for pin in self.read_gpio_events():
+                    # Debounce on the monotonic clock
+                    now = time.monotonic()
+                    if now - self._last_press[pin] < 0.2:
+                        continue
+                    self._last_press[pin] = now
+                    self.button_callback(pin)
+            except Exception as e:
+                self.logger.error(f"GPIO thread error: {e}")
+                time.sleep(1)
+
+    def check_i2c_bus_speed(self, port, bus_speed):
+        """Warn if the I2C bus runs slower than requested
+        
+        The bus clock is fixed by the device tree at boot and cannot be
+        changed from i2c-dev, so this only reports it.
+        """
+        freq_file = Path(f'/sys/class/i2c-adapter/i2c-{port}/of_node/clock-frequency')
+        try:
+            current = int.from_bytes(freq_file.read_bytes()[:4], 'big')
+        except Exception:
+            return
+        
+        if current < bus_speed:
+            self.logger.warning(
+                f"I2C bus {port} runs at {current // 1000} kHz, {bus_speed // 1000} kHz recommended "
+                f"(set the i2c{port} clock-frequency in the boot overlay)"
+            )
+
+    def probe_display_addresses(self, port, addresses):
+        """Return the candidate addresses worth initializing, in order
+        
+        A zero-length write is acked only by a device that is present, which
+        is much cheaper than a failed luma init. If the adapter cannot do
+        quick writes all candidates are returned unprobed.
+        """
+        with SMBus(port) as bus:
+            if not bus.funcs & I2cFunc.SMBUS_QUICK:
+                return list(addresses)
+            
+            for addr in addresses:
+                try:
+                    bus.write_quick(addr)
+                    return [addr]
+                except OSError:
+                    continue
+        
+        return []
+
+    def setup_display(self, bus_speed=400000):
+        """Setup OLED display
+        
+        The SSD1306 refresh is bound by I2C bandwidth, so bus_speed documents
+        the bus clock (fast-mode, 400 kHz) the display is expected to run at.
+        """
+        # One frame and drawing context reused for every refresh
+        self._frame = Image.new('1', (128, 64))
+        self._draw = ImageDraw.Draw(self._frame)
+        
         try:
-            # Try different I2C addresses
-            addresses = [0x3C, 0x3D]
+            self.check_i2c_bus_speed(1, bus_speed)
+            
+            # Find the display on the bus before paying for the luma init
+            addresses = self.probe_display_addresses(1, [0x3C, 0x3D])
             self.device = None
             
             for addr in addresses:
@@ -175,11 +362,13 @@ class NanoPiOLEDMonitor:
         """Handle button press"""
         try:
             if channel == self.button_pins[0]:  # F1 - Change display mode
-                self.current_mode = (self.current_mode + 1) % len(self.display_modes)
+                self.current_mode = (self.current_mode + 1) % len(self._draw_fns)
                 self.logger.info(f"Switched to mode: {self.display_modes[self.current_mode]}")
+                self._wake.set()
             
             elif channel == self.button_pins[1]:  # F2 - Change timezone
                 self.cycle_timezone()
+                self._wake.set()
             
             elif channel == self.button_pins[2]:  # F3 - Force NTP sync
                 self.sync_ntp()
@@ -190,7 +379,7 @@ class NanoPiOLEDMonitor:
     def cycle_timezone(self):
         """Cycle through common timezones"""
         timezones = [
-            'UTC', 'EST', 'PST', 'GMT', 'CET', 'JST', 
+            'UTC', 'EST', 'PST8PDT', 'GMT', 'CET', 'Japan', 
             'Asia/Shanghai', 'Europe/London', 'America/New_York',
             'America/Los_Angeles', 'Asia/Tokyo'
         ]
@@ -198,27 +387,84 @@ class NanoPiOLEDMonitor:
         try:
             current_tz = self.config['timezone']
             current_index = timezones.index(current_tz) if current_tz in timezones else 0
-            next_index = (current_index + 1) % len(timezones)
+            
+            # Skip zones missing from this system's tz database instead of sticking on them
+            for step in range(1, len(timezones) + 1):
+                next_index = (current_index + step) % len(timezones)
+                try:
+                    self.timezone = ZoneInfo(timezones[next_index])
+                    break
+                except Exception as e:
+                    self.logger.warning(f"Skipping timezone {timezones[next_index]}: {e}")
+            else:
+                return
             
             self.config['timezone'] = timezones[next_index]
-            self.timezone = pytz.timezone(timezones[next_index])
+            self._tz_label = timezones[next_index].split('/')[-1]
             self.save_config()
             
             self.logger.info(f"Timezone changed to: {timezones[next_index]}")
         except Exception as e:
             self.logger.error(f"Timezone change error: {e}")
 
+    def _sntp_query(self, server):
+        """Query an NTP server with a single SNTP packet and return the clock offset (s)"""
+        ntp_epoch_delta = 2208988800  # Seconds from 1900-01-01 to 1970-01-01
+        
+        def ntp_to_unix(seconds, fraction):
+            return seconds - ntp_epoch_delta + fraction / 2**32
+        
+        # LI=0, VN=3, Mode=3 (client)
+        request = b'\x1b' + b'\x00' * 47
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(2)
+            t1 = time.time()
+            sock.sendto(request, (server, 123))
+            packet, _ = sock.recvfrom(48)
+            t4 = time.time()
+        
+        if len(packet) < 48:
+            raise ValueError(f"Short SNTP reply from {server}")
+        
+        # Only a server-mode reply from a synchronized server (stratum 1-15) is usable
+        if packet[0] & 0x7 != 4 or not 0 < packet[1] < 16:
+            raise ValueError(f"Unusable SNTP reply from {server}")
+        
+        # Server receive (T2) and transmit (T3) timestamps
+        t2 = ntp_to_unix(*struct.unpack('!II', packet[32:40]))
+        t3 = ntp_to_unix(*struct.unpack('!II', packet[40:48]))
+        if t3 <= 0:
+            raise ValueError(f"Unsynchronized SNTP reply from {server}")
+        
+        return ((t2 - t1) + (t3 - t4)) / 2
+
     def sync_ntp(self):
         """Synchronize time with NTP servers"""
         try:
+            for server in self.config['ntp_servers']:
+                try:
+                    offset = self._sntp_query(server)
+                    if abs(offset) > self.ntp_step_threshold:
+                        subprocess.check_call(['sudo', 'date', '-s', '@%f' % (time.time() + offset)],
+                                            timeout=10,
+                                            stdout=subprocess.DEVNULL,
+                                            stderr=subprocess.DEVNULL)
+                    self.last_ntp_sync = time.monotonic()
+                    self.logger.info(f"NTP sync successful with {server} (offset {offset:+.3f}s)")
+                    return True
+                except:
+                    continue
+            
+            # Fall back to ntpdate if SNTP is blocked or date could not be set
             for server in self.config['ntp_servers']:
                 try:
                     subprocess.check_call(['sudo', 'ntpdate', '-s', server], 
                                         timeout=10, 
                                         stdout=subprocess.DEVNULL, 
                                         stderr=subprocess.DEVNULL)
-                    self.last_ntp_sync = time.time()
-                    self.logger.info(f"NTP sync successful with {server}")
+                    self.last_ntp_sync = time.monotonic()
+                    self.logger.info(f"NTP sync successful with {server} (ntpdate)")
                     return True
                 except:
                     continue
@@ -230,22 +476,75 @@ class NanoPiOLEDMonitor:
             self.logger.error(f"NTP sync error: {e}")
             return False
 
+    def read_proc(self, fd, size=2048):
+        """Re-read an open /proc file from the start"""
+        os.lseek(fd, 0, os.SEEK_SET)
+        return os.read(fd, size)
+
+    def read_cpu_times(self):
+        """Return (idle, total) jiffies from the aggregate cpu line of /proc/stat"""
+        fields = [int(v) for v in self.read_proc(self._stat_fd, 256).split(b'\n', 1)[0].split()[1:9]]
+        idle = fields[3] + fields[4]  # idle + iowait
+        return idle, sum(fields)
+
+    def get_cpu_percent(self):
+        """CPU usage since the previous call"""
+        idle, total = self.read_cpu_times()
+        last_idle, last_total = self._cpu_times
+        self._cpu_times = (idle, total)
+        
+        delta_total = total - last_total
+        if delta_total <= 0:
+            return 0.0
+        return 100.0 * (1 - (idle - last_idle) / delta_total)
+
+    def get_memory_info(self):
+        """Return (total, available) memory in kB"""
+        match = MEMINFO_RE.search(self.read_proc(self._meminfo_fd))
+        return int(match.group(1)), int(match.group(2))
+
+    def get_disk_usage(self):
+        """Return (used, total) bytes and used percent of the root filesystem, cached for a while"""
+        cached_at, usage = self._disk_cache
+        if usage is not None and time.monotonic() - cached_at < self.disk_cache_ttl:
+            return usage
+        
+        # Same figures as df: root-reserved blocks count neither as used nor as available
+        st = os.statvfs('/')
+        total = st.f_frsize * st.f_blocks
+        used = st.f_frsize * (st.f_blocks - st.f_bfree)
+        avail = st.f_frsize * st.f_bavail
+        usage = (used, total, 100 * used / (used + avail) if used + avail else 0)
+        self._disk_cache = (time.monotonic(), usage)
+        return usage
+
     def get_system_info(self):
         """Get system information"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            cpu_percent = self.get_cpu_percent()
+            memory_total, memory_available = self.get_memory_info()
+            memory_used = memory_total - memory_available
+            disk_used, disk_total, disk_percent = self.get_disk_usage()
             
-            return {
+            info = {
                 'cpu': cpu_percent,
-                'memory_percent': memory.percent,
-                'memory_used': memory.used // (1024**2),  # MB
-                'memory_total': memory.total // (1024**2),  # MB
-                'disk_percent': disk.percent,
-                'disk_used': disk.used // (1024**3),  # GB
-                'disk_total': disk.total // (1024**3)  # GB
+                'memory_percent': 100 * memory_used / memory_total,
+                'memory_used': memory_used >> 10,  # MB
+                'memory_total': memory_total >> 10,  # MB
+                'disk_percent': disk_percent,
+                'disk_used': disk_used >> 30,  # GB
+                'disk_total': disk_total >> 30  # GB
             }
+            
+            # Screen lines are formatted here, on the sampler thread
+            info['lines'] = [
+                "CPU: %.1f%%" % info['cpu'],
+                "RAM: %.1f%%" % info['memory_percent'],
+                "     %dMB/%dMB" % (info['memory_used'], info['memory_total']),
+                "Disk: %.1f%%" % info['disk_percent'],
+                "      %dGB/%dGB" % (info['disk_used'], info['disk_total'])
+            ]
+            return info
         except Exception as e:
             self.logger.error(f"System info error: {e}")
             return None
@@ -253,39 +552,80 @@ class NanoPiOLEDMonitor:
     def get_network_info(self):
         """Get network information"""
         try:
-            # Get IP address
-            result = subprocess.run(['hostname', '-I'], 
-                                  capture_output=True, text=True, timeout=5)
-            ip_addresses = result.stdout.strip().split()
+            # Get IP addresses
+            ip_addresses = self.get_ip_addresses()
+            
+            # Get network stats as rates since the previous sample
+            net_io = psutil.net_io_counters(nowrap=False)
+            now = time.monotonic()
+            tx_rate = rx_rate = 0.0
             
-            # Get network stats
-            net_io = psutil.net_io_counters()
+            if self._net_io_last:
+                last_time, last_sent, last_recv = self._net_io_last
+                elapsed = now - last_time
+                if elapsed > 0:
+                    # Raw counters may wrap, never report a negative rate
+                    tx_rate = max(0, net_io.bytes_sent - last_sent) / elapsed
+                    rx_rate = max(0, net_io.bytes_recv - last_recv) / elapsed
+            
+            self._net_io_last = (now, net_io.bytes_sent, net_io.bytes_recv)
             
             return {
                 'ip_addresses': ip_addresses,
-                'bytes_sent': net_io.bytes_sent // (1024**2),  # MB
-                'bytes_recv': net_io.bytes_recv // (1024**2),  # MB
+                'tx_rate': tx_rate / 1024,  # KB/s
+                'rx_rate': rx_rate / 1024,  # KB/s
             }
         except Exception as e:
             self.logger.error(f"Network info error: {e}")
             return None
 
+    def get_ip_addresses(self):
+        """Get IPv4 addresses of all non-loopback interfaces, cached for a while"""
+        cached_at, ip_addresses = self._net_cache
+        if ip_addresses is not None and time.monotonic() - cached_at < self.net_cache_ttl:
+            return ip_addresses
+        
+        ip_addresses = [
+            addr.address
+            for iface, addrs in psutil.net_if_addrs().items() if iface != 'lo'
+            for addr in addrs if addr.family == socket.AF_INET
+        ]
+        self._net_cache = (time.monotonic(), ip_addresses)
+        return ip_addresses
+
+    def open_temperature_sensor(self):
+        """Find the first readable temperature file and keep it open"""
+        # Try multiple temperature sources
+        temp_files = [
+            '/sys/class/thermal/thermal_zone0/temp',
+            '/sys/class/hwmon/hwmon0/temp1_input'
+        ]
+        
+        for temp_file in temp_files:
+            try:
+                fd = os.open(temp_file, os.O_RDONLY)
+            except OSError:
+                continue
+            
+            try:
+                int(os.pread(fd, 16, 0))
+            except (OSError, ValueError):
+                os.close(fd)
+                continue
+            
+            self._temp_path = temp_file
+            self._temp_fd = fd
+            self.logger.info(f"Using temperature sensor {temp_file}")
+            return
+
     def get_temperature(self):
         """Get system temperature"""
         try:
-            # Try multiple temperature sources
-            temp_files = [
-                '/sys/class/thermal/thermal_zone0/temp',
-                '/sys/class/hwmon/hwmon0/temp1_input'
-            ]
-            
-            for temp_file in temp_files:
+            if self._temp_fd is not None:
                 try:
-                    with open(temp_file, 'r') as f:
-                        temp = int(f.read().strip()) / 1000.0
-                        return temp
-                except:
-                    continue
+                    return int(os.pread(self._temp_fd, 16, 0)) / 1000.0
+                except (OSError, ValueError):
+                    pass
             
             # Fallback to psutil if available
             temps = psutil.sensors_temperatures()
@@ -300,6 +640,13 @@ class NanoPiOLEDMonitor:
             self.logger.error(f"Temperature reading error: {e}")
             return None
 
+    def _render_glyph(self, text):
+        """Rasterize a piece of clock text into its own tile"""
+        glyph_width = max(1, round(self.font.getlength(text)))
+        glyph = Image.new('1', (glyph_width, self._glyph_height))
+        ImageDraw.Draw(glyph).text((0, 0), text, fill="white", font=self.font)
+        return glyph
+
     def draw_datetime(self, draw, width, height):
         """Draw date and time display"""
         try:
@@ -311,64 +658,62 @@ class NanoPiOLEDMonitor:
             # Time
             time_str = now.strftime("%H:%M:%S")
             
-            # Timezone
-            tz_str = str(self.timezone).split('/')[-1]
-            
             # Draw text
-            draw.text((0, 0), date_str, fill="white")
-            draw.text((0, 20), time_str, fill="white")
-            draw.text((0, 40), f"TZ: {tz_str}", fill="white")
+            draw.text((0, 0), date_str, fill="white", font=self.font)
+            hm_str, hm_img = self._hm_tile
+            if hm_str != time_str[:6]:
+                hm_str, hm_img = self._hm_tile = (time_str[:6], self._render_glyph(time_str[:6]))
+            self._frame.paste(hm_img, (0, 20))
+            self._frame.paste(self._sec_imgs[time_str[6:]], (self._sec_x, 20))
+            draw.text((0, 40), f"TZ: {self._tz_label}", fill="white", font=self.font)
             
         except Exception as e:
-            draw.text((0, 0), f"Time Error: {str(e)[:15]}", fill="white")
+            draw.text((0, 0), f"Time Error: {str(e)[:15]}", fill="white", font=self.font)
 
     def draw_system_info(self, draw, width, height):
         """Draw system information"""
         try:
-            info = self.get_system_info()
+            info = self._snapshot.get('sys')
             if not info:
-                draw.text((0, 0), "System info unavailable", fill="white")
+                draw.text((0, 0), "System info unavailable", fill="white", font=self.font)
                 return
             
-            draw.text((0, 0), f"CPU: {info['cpu']:.1f}%", fill="white")
-            draw.text((0, 12), f"RAM: {info['memory_percent']:.1f}%", fill="white")
-            draw.text((0, 24), f"     {info['memory_used']}MB/{info['memory_total']}MB", fill="white")
-            draw.text((0, 36), f"Disk: {info['disk_percent']:.1f}%", fill="white")
-            draw.text((0, 48), f"      {info['disk_used']}GB/{info['disk_total']}GB", fill="white")
+            for i, line in enumerate(info['lines']):
+                draw.text((0, i * 12), line, fill="white", font=self.font)
             
         except Exception as e:
-            draw.text((0, 0), f"Sys Error: {str(e)[:15]}", fill="white")
+            draw.text((0, 0), f"Sys Error: {str(e)[:15]}", fill="white", font=self.font)
 
     def draw_network_info(self, draw, width, height):
         """Draw network information"""
         try:
-            info = self.get_network_info()
+            info = self._snapshot.get('net')
             if not info:
-                draw.text((0, 0), "Network info unavailable", fill="white")
+                draw.text((0, 0), "Network info unavailable", fill="white", font=self.font)
                 return
             
-            draw.text((0, 0), "Network Info", fill="white")
+            draw.text((0, 0), "Network Info", fill="white", font=self.font)
             
             y_pos = 12
             for ip in info['ip_addresses'][:2]:  # Show max 2 IPs
-                draw.text((0, y_pos), f"IP: {ip}", fill="white")
+                draw.text((0, y_pos), f"IP: {ip}", fill="white", font=self.font)
                 y_pos += 12
             
-            draw.text((0, y_pos), f"TX: {info['bytes_sent']}MB", fill="white")
-            draw.text((0, y_pos + 12), f"RX: {info['bytes_recv']}MB", fill="white")
+            draw.text((0, y_pos), f"TX: {info['tx_rate']:.1f}KB/s", fill="white", font=self.font)
+            draw.text((0, y_pos + 12), f"RX: {info['rx_rate']:.1f}KB/s", fill="white", font=self.font)
             
         except Exception as e:
-            draw.text((0, 0), f"Net Error: {str(e)[:15]}", fill="white")
+            draw.text((0, 0), f"Net Error: {str(e)[:15]}", fill="white", font=self.font)
 
     def draw_temperature(self, draw, width, height):
         """Draw temperature information"""
         try:
-            temp = self.get_temperature()
+            temp = self._snapshot.get('temp')
             
-            draw.text((0, 0), "Temperature", fill="white")
+            draw.text((0, 0), "Temperature", fill="white", font=self.font)
             
             if temp is not None:
-                draw.text((0, 20), f"CPU: {temp:.1f}°C", fill="white")
+                draw.text((0, 20), f"CPU: {temp:.1f}°C", fill="white", font=self.font)
                 
                 # Temperature status
                 if temp < 50:
@@ -378,13 +723,39 @@ class NanoPiOLEDMonitor:
                 else:
                     status = "HOT!"
                 
-                draw.text((0, 40), f"Status: {status}", fill="white")
+                draw.text((0, 40), f"Status: {status}", fill="white", font=self.font)
             else:
-                draw.text((0, 20), "Temperature sensor", fill="white")
-                draw.text((0, 32), "not available", fill="white")
+                draw.text((0, 20), "Temperature sensor", fill="white", font=self.font)
+                draw.text((0, 32), "not available", fill="white", font=self.font)
                 
         except Exception as e:
-            draw.text((0, 0), f"Temp Error: {str(e)[:15]}", fill="white")
+            draw.text((0, 0), f"Temp Error: {str(e)[:15]}", fill="white", font=self.font)
+
+    def frame_pages(self, frame):
+        """Split a 128x64 frame into SSD1306 pages (one byte per column, LSB on top)"""
+        return [
+            frame.crop((0, page * 8, 128, page * 8 + 8)).transpose(Image.ROTATE_270).tobytes()
+            for page in range(8)
+        ]
+
+    def push_frame(self, frame):
+        """Send only the parts of the frame that changed since the last push"""
+        pages = self.frame_pages(frame)
+        
+        if self._last_pages is None:
+            self.device.display(frame)
+        else:
+            for page, (new, old) in enumerate(zip(pages, self._last_pages)):
+                if new == old:
+                    continue
+                
+                # Narrow the column window to the changed span of this page
+                changed = [x for x in range(128) if new[x] != old[x]]
+                col0, col1 = changed[0], changed[-1]
+                self.device.command(0x21, col0, col1, 0x22, page, page)
+                self.device.data(list(new[col0:col1 + 1]))
+        
+        self._last_pages = pages
 
     def update_display(self):
         """Update the OLED display"""
@@ -393,41 +764,55 @@ class NanoPiOLEDMonitor:
                 if not self.device:
                     return
                 
-                with canvas(self.device) as draw:
-                    mode = self.display_modes[self.current_mode]
-                    
-                    if mode == 'datetime':
-                        self.draw_datetime(draw, 128, 64)
-                    elif mode == 'system_info':
-                        self.draw_system_info(draw, 128, 64)
-                    elif mode == 'network_info':
-                        self.draw_network_info(draw, 128, 64)
-                    elif mode == 'temperature':
-                        self.draw_temperature(draw, 128, 64)
+                self._draw.rectangle((0, 0, 128, 64), fill=0)
+                self._draw_fns[self.current_mode](self._draw, 128, 64)
+                
+                self.push_frame(self._frame)
                     
         except Exception as e:
+            # Panel contents are unknown after a failed write, resend everything next time
+            self._last_pages = None
             self.logger.error(f"Display update error: {e}")
 
     def auto_ntp_sync(self):
         """Automatically sync NTP if needed"""
-        if time.time() - self.last_ntp_sync > self.ntp_sync_interval:
+        if time.monotonic() - self.last_ntp_sync > self.ntp_sync_interval:
             self.sync_ntp()
 
     def display_thread(self):
         """Main display update thread"""
         while self.running:
             try:
+                self._wake.clear()
                 self.auto_ntp_sync()
                 self.update_display()
-                time.sleep(self.config['refresh_rate'])
+                
+                # Sleep until the next refresh_rate boundary of the wall clock
+                # (whole seconds by default) unless woken early
+                rate = self.config['refresh_rate']
+                self._wake.wait(timeout=max(0.01, rate - (time.time() % rate)))
             except Exception as e:
                 self.logger.error(f"Display thread error: {e}")
-                time.sleep(5)
+                self._wake.wait(timeout=5)
+
+    def sampler_thread(self):
+        """Background sensor sampling thread, each sensor on its own cadence"""
+        next_due = dict.fromkeys(self._samplers, 0)
+        
+        while self.running:
+            now = time.monotonic()
+            for name, (sample, interval) in self._samplers.items():
+                if now >= next_due[name]:
+                    self._snapshot = {**self._snapshot, name: sample()}
+                    next_due[name] = now + interval
+            
+            time.sleep(max(0, min(next_due.values()) - time.monotonic()))
 
     def signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         self.logger.info("Shutdown signal received")
         self.running = False
+        self._wake.set()
 
     def run(self):
         """Main run method"""
@@ -438,11 +823,22 @@ class NanoPiOLEDMonitor:
         # Initial NTP sync
         self.sync_ntp()
         
+        # Start sensor sampler ahead of the display so the first frame has data
+        sampler_thread = threading.Thread(target=self.sampler_thread)
+        sampler_thread.daemon = True
+        sampler_thread.start()
+        
         # Start display thread
         display_thread = threading.Thread(target=self.display_thread)
         display_thread.daemon = True
         display_thread.start()
         
+        # Start button event thread when using libgpiod
+        if self._gpio_lines:
+            gpio_thread = threading.Thread(target=self.gpio_thread)
+            gpio_thread.daemon = True
+            gpio_thread.start()
+        
         self.logger.info("NanoPi OLED Monitor started")
         
         try:
@@ -466,10 +862,23 @@ class NanoPiOLEDMonitor:
             pass
         
         try:
-            GPIO.cleanup()
+            if self._gpio_lines:
+                self._gpio_lines.release()
+            elif GPIO is not None:
+                GPIO.cleanup()
         except:
             pass
         
+        if self._temp_fd is not None:
+            os.close(self._temp_fd)
+            self._temp_fd = None
+        
+        for fd in (self._meminfo_fd, self._stat_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        
         self.logger.info("Cleanup completed")
 
 def create_systemd_service():
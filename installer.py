@@ -34,6 +34,23 @@ silent_run() {
     "$@" >/dev/null 2>&1
 }
 
+# Append the lines a config file is missing, scanning it in a single awk pass.
+# Arguments after the file come in pairs: a line prefix to look for, and the
+# line to append when no existing line starts with that prefix.
+append_missing_lines() {
+    local file="$1" src="$1" missing
+    shift
+    [[ -r "$file" ]] || src=/dev/null
+    missing=$(awk '
+        BEGIN { for (i = 1; i < ARGC; i += 2) { want[ARGV[i]] = ARGV[i + 1]; order[++n] = ARGV[i] } ARGC = 1 }
+        { for (p in want) if (index($0, p) == 1) delete want[p] }
+        END { for (i = 1; i <= n; i++) if (order[i] in want) print want[order[i]] }
+    ' "$@" < "$src")
+    if [[ -n "$missing" ]]; then
+        echo "$missing" | sudo tee -a "$file" >/dev/null
+    fi
+}
+
 echo "=== NanoPi NEO OLED Monitor - Silent Installation ==="
 echo "Installation log: $INSTALL_LOG"
 echo ""
@@ -68,6 +85,8 @@ silent_run sudo DEBIAN_FRONTEND=noninteractive apt-get install -y \
     python3-dev \
     python3-setuptools \
     python3-venv \
+    python3-libgpiod \
+    python3-systemd \
     git \
     i2c-tools \
     ntpdate \
@@ -91,11 +110,11 @@ print_success "Dependencies installed"
 print_status "Configuring I2C interface..."
 
 # Add i2c modules
-if ! grep -q "^i2c-dev" /etc/modules 2>/dev/null; then
-    echo "i2c-dev" | sudo tee -a /etc/modules >/dev/null
-fi
+append_missing_lines /etc/modules "i2c-dev" "i2c-dev"
 
-# Configure boot settings
+# Configure boot settings. SSD1306 panels handle I2C fast-mode (400 kHz);
+# boards rated for fast-mode plus can set I2C_BAUDRATE=1000000.
+I2C_BAUDRATE="${I2C_BAUDRATE:-400000}"
 BOOT_CONFIG=""
 for config_path in "/boot/config.txt" "/boot/firmware/config.txt" "/boot/firmware/usercfg.txt"; do
     if [[ -f "$config_path" ]]; then
@@ -105,12 +124,11 @@ for config_path in "/boot/config.txt" "/boot/firmware/config.txt" "/boot/firmwar
 done
 
 if [[ -n "$BOOT_CONFIG" ]]; then
-    if ! grep -q "^dtparam=i2c_arm=on" "$BOOT_CONFIG" 2>/dev/null; then
-        echo "dtparam=i2c_arm=on" | sudo tee -a "$BOOT_CONFIG" >/dev/null
-    fi
-    if ! grep -q "^dtparam=i2c1_baudrate" "$BOOT_CONFIG" 2>/dev/null; then
-        echo "dtparam=i2c1_baudrate=100000" | sudo tee -a "$BOOT_CONFIG" >/dev/null
-    fi
+    # Earlier versions of this installer wrote a 100 kHz line, raise it
+    sudo sed -i "s/^dtparam=i2c1_baudrate=100000$/dtparam=i2c1_baudrate=$I2C_BAUDRATE/" "$BOOT_CONFIG"
+    append_missing_lines "$BOOT_CONFIG" \
+        "dtparam=i2c_arm=on" "dtparam=i2c_arm=on" \
+        "dtparam=i2c1_baudrate" "dtparam=i2c1_baudrate=$I2C_BAUDRATE"
 fi
 
 # Add user to i2c and gpio groups
@@ -127,14 +145,22 @@ print_success "Directory created: $APP_DIR"
 
 # Create Python virtual environment
 print_status "Setting up Python environment..."
-silent_run python3 -m venv venv
+silent_run python3 -m venv --system-site-packages venv
 source venv/bin/activate
-silent_run pip install --upgrade pip setuptools wheel
+
+# Prebuilt ARM wheels from piwheels, so Pillow and friends are not compiled on the board
+cat > venv/pip.conf << EOF
+[global]
+extra-index-url = https://www.piwheels.org/simple
+EOF
 print_success "Virtual environment ready"
 
-# Install Python dependencies
+# Install pip tooling and Python dependencies in one resolver pass
 print_status "Installing Python packages..."
-silent_run pip install \
+silent_run pip install --upgrade --prefer-binary --no-cache-dir \
+    pip \
+    setuptools \
+    wheel \
     luma.oled \
     psutil \
     pytz \
@@ -149,49 +175,76 @@ print_status "Creating application..."
 cat > "$APP_DIR/nanopi_oled_monitor.py" << 'EOF'
 #!/usr/bin/env python3
 """
-NanoPi NEO OLED System Monitor - Silent Auto-Install Version
+NanoPi NEO OLED System Monitor
 """
 
 import os
 import sys
 import time
 import json
+import hashlib
 import threading
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import Any, Optional
 import signal
 import logging
 from pathlib import Path
 import socket
+import struct
 
-# Auto-install packages silently
-def install_packages():
-    required_packages = ['luma.oled', 'psutil', 'pytz', 'RPi.GPIO', 'Pillow']
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_').replace('.', '_'))
-        except ImportError:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', '--user', package], 
-                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-try:
-    install_packages()
-except:
-    pass
-
-# Import packages
+# Import packages, installed into the venv by the installer
 try:
     from luma.core.interface.serial import i2c
-    from luma.core.render import canvas
     from luma.oled.device import ssd1306
     from PIL import Image, ImageDraw, ImageFont
-    import RPi.GPIO as GPIO
     import psutil
     import pytz
 except ImportError as e:
     print(f"Import error: {e}")
+    print("Run the NanoPi OLED Monitor installer again to reinstall the Python packages")
     sys.exit(1)
 
+# systemd readiness/watchdog notifications, with a plain NOTIFY_SOCKET fallback
+try:
+    from systemd.daemon import notify as sd_notify
+except ImportError:
+    def sd_notify(state):
+        addr = os.environ.get('NOTIFY_SOCKET')
+        if not addr:
+            return False
+        if addr[0] == '@':
+            addr = '\0' + addr[1:]
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+                sock.connect(addr)
+                sock.sendall(state.encode())
+            return True
+        except OSError:
+            return False
+
+# libgpiod is preferred for buttons, RPi.GPIO stays as the fallback
+try:
+    import gpiod
+except ImportError:
+    gpiod = None
+
+# RPi.GPIO raises RuntimeError on import on non-Raspberry Pi boards like the H3
+try:
+    import RPi.GPIO as GPIO
+except (ImportError, RuntimeError):
+    GPIO = None
+
+@dataclass
+class Stats:
+    cpu: float = 0.0
+    memory: Any = None
+    disk: Any = None
+    net_io: Any = None
+    temp: Optional[float] = None
+    uptime: Optional[float] = None
+
 class NanoPiOLEDMonitor:
     def __init__(self):
         self.config_file = Path.home() / '.nanopi_monitor_config.json'
@@ -206,18 +259,54 @@ class NanoPiOLEDMonitor:
         self.logger = logging.getLogger(__name__)
         
         self.config = self.load_config()
+        self._config_dirty = False
+        self._config_flush_ts = time.monotonic()
         self.display_modes = ['datetime', 'system_info', 'network_info', 'temperature', 'uptime']
         self.current_mode = 0
         self.button_pins = [16, 20, 21]
+        self._prev_pages = None
+        self._last_fb_hash = None
+        self._redraw = threading.Event()
+        # systemd sets WATCHDOG_USEC for units with WatchdogSec=; ping well under half of it
+        self._watchdog_wait = int(os.environ.get('WATCHDOG_USEC', 30_000_000)) / 1e6 / 3
         
         self.setup_gpio()
         self.setup_display()
+        # The bitmap font: Pillow >= 10.1 load_default() is FreeType, whose hinted layout
+        # differs from getlength() and would misplace label values against their tiles
+        self.font = getattr(ImageFont, 'load_default_imagefont', ImageFont.load_default)()
+        self._label_cache = {}
+        self._frame = None
         
         self.timezone = pytz.timezone(self.config.get('timezone', 'UTC'))
         self.running = True
         self.display_lock = threading.Lock()
-        self.last_ntp_sync = 0
-        self.ntp_sync_interval = 3600
+        self.ntp_sync_file = Path.home() / '.nanopi_ntp_sync'
+        self.last_ntp_sync, self._clock_synced = self.load_last_ntp_sync()
+        self._ntp_lock = threading.Lock()
+        self.ntp_sync_interval = 86400
+        self._net_cache = (0.0, None)
+        self._ntp_ip_cache = {}
+        self._stats = Stats()
+        self._disk_ts = 0.0
+        self._temp_fd = None
+        for temp_file in ['/sys/class/thermal/thermal_zone0/temp', '/sys/class/hwmon/hwmon0/temp1_input']:
+            try:
+                fd = os.open(temp_file, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                int(os.pread(fd, 16, 0))
+                self._temp_fd = fd
+                break
+            except (OSError, ValueError):
+                os.close(fd)
+        try:
+            with open('/proc/uptime', 'r') as f:
+                self._boot_mono = time.monotonic() - float(f.readline().split()[0])
+        except:
+            self._boot_mono = None
+        psutil.cpu_percent(interval=None)
 
     def load_config(self):
         default_config = {
@@ -226,7 +315,8 @@ class NanoPiOLEDMonitor:
             'ntp_servers': ['pool.ntp.org', 'time.google.com'],
             'refresh_rate': 1.0,
             'temperature_unit': 'C',
-            'show_seconds': True
+            'show_seconds': True,
+            'gpio_chip': '/dev/gpiochip1'
         }
         
         if self.config_file.exists():
@@ -238,23 +328,104 @@ class NanoPiOLEDMonitor:
                 pass
         return default_config
 
+    def load_last_ntp_sync(self):
+        # Returns (last sync stamp, whether the kernel clock is already NTP-synchronized).
+        # Without an RTC the boot clock may be anywhere relative to the stored stamp,
+        # so only timesyncd/chrony reporting a synchronized clock can skip the boot sync.
+        try:
+            result = subprocess.run(['timedatectl', 'show', '-p', 'NTPSynchronized', '--value'],
+                                    capture_output=True, text=True, timeout=5)
+            if result.stdout.strip() == 'yes':
+                return time.time(), True
+        except:
+            pass
+        try:
+            return float(self.ntp_sync_file.read_text().strip() or 0), False
+        except:
+            return 0, False
+
+    def ntp_fresh(self):
+        # The stored stamp only counts once this process has synced or the system clock
+        # is known synchronized; a stamp from the future means the clock was stepped back
+        return self._clock_synced and 0 <= time.time() - self.last_ntp_sync < self.ntp_sync_interval
+
     def save_config(self):
+        # Writes are batched to spare the SD card, see _flush_config
+        self._config_dirty = True
+
+    def _flush_config(self):
+        self._config_flush_ts = time.monotonic()
+        if not self._config_dirty:
+            return
+        # Cleared first, so a button press while the file is written marks it dirty again
+        self._config_dirty = False
         try:
-            with open(self.config_file, 'w') as f:
+            tmp_file = self.config_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
+            os.replace(tmp_file, self.config_file)
         except:
-            pass
+            self._config_dirty = True
 
     def setup_gpio(self):
+        self._gpio_lines = None
+        self._last_edge = dict.fromkeys(self.button_pins, 0.0)
+        if gpiod is not None:
+            try:
+                self._gpio_lines = self.request_gpio_lines()
+                return
+            except:
+                self._gpio_lines = None
+        if GPIO is None:
+            return
         try:
             GPIO.setmode(GPIO.BCM)
             GPIO.setwarnings(False)
             for pin in self.button_pins:
                 GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-                GPIO.add_event_detect(pin, GPIO.FALLING, callback=self.button_callback, bouncetime=300)
+                GPIO.add_event_detect(pin, GPIO.FALLING, callback=self._on_edge)
         except:
             pass
 
+    def request_gpio_lines(self):
+        if hasattr(gpiod, 'request_lines'):  # libgpiod v2
+            settings = gpiod.LineSettings(edge_detection=gpiod.line.Edge.FALLING,
+                                          bias=gpiod.line.Bias.PULL_UP)
+            return gpiod.request_lines(self.config['gpio_chip'], consumer='oled',
+                                       config={tuple(self.button_pins): settings})
+        lines = gpiod.Chip(self.config['gpio_chip']).get_lines(self.button_pins)
+        lines.request(consumer='oled', type=gpiod.LINE_REQ_EV_FALLING_EDGE,
+                      flags=getattr(gpiod, 'LINE_REQ_FLAG_BIAS_PULL_UP', 0))
+        return lines
+
+    def read_gpio_events(self):
+        lines = self._gpio_lines
+        if hasattr(lines, 'wait_edge_events'):  # libgpiod v2
+            if not lines.wait_edge_events(timedelta(seconds=1)):
+                return []
+            return [event.line_offset for event in lines.read_edge_events()]
+        fired = lines.event_wait(sec=1)
+        if not fired:
+            return []
+        return [line.event_read().source.offset() for line in fired]
+
+    def _on_edge(self, pin):
+        # Debounce on the monotonic clock, one compare and store per edge
+        now = time.monotonic()
+        if now - self._last_edge[pin] < 0.3:
+            return
+        self._last_edge[pin] = now
+        self.button_callback(pin)
+
+    def gpio_thread(self):
+        # Blocks in the kernel between presses, no userspace polling
+        while self.running:
+            try:
+                for pin in self.read_gpio_events():
+                    self._on_edge(pin)
+            except:
+                time.sleep(1)
+
     def setup_display(self):
         try:
             addresses = [0x3C, 0x3D]
@@ -277,8 +448,10 @@ class NanoPiOLEDMonitor:
         try:
             if channel == self.button_pins[0]:
                 self.current_mode = (self.current_mode + 1) % len(self.display_modes)
+                self._redraw.set()
             elif channel == self.button_pins[1]:
                 self.cycle_timezone()
+                self._redraw.set()
             elif channel == self.button_pins[2]:
                 threading.Thread(target=self.sync_ntp, daemon=True).start()
         except:
@@ -298,27 +471,123 @@ class NanoPiOLEDMonitor:
         except:
             pass
 
+    def _resolve_ntp(self, host):
+        ip, expiry = self._ntp_ip_cache.get(host, (None, 0))
+        if ip is None or time.monotonic() >= expiry:
+            ip = socket.gethostbyname(host)
+            self._ntp_ip_cache[host] = (ip, time.monotonic() + 3600)
+        return ip
+
+    def _default_gateway(self):
+        # Destination 0.0.0.0 with RTF_GATEWAY set, addresses are hex in host byte order
+        with open('/proc/net/route', 'r') as f:
+            for line in f.readlines()[1:]:
+                fields = line.split()
+                if len(fields) > 3 and fields[1] == '00000000' and int(fields[3], 16) & 0x2:
+                    return socket.inet_ntoa(struct.pack('=L', int(fields[2], 16)))
+        return None
+
+    def _effective_ntp_list(self):
+        # The local router often serves NTP, one LAN round trip and no DNS
+        servers = list(self.config['ntp_servers'])
+        try:
+            gateway = self._default_gateway()
+        except:
+            gateway = None
+        if gateway and gateway not in servers:
+            servers.insert(0, gateway)
+        return gateway, servers
+
+    def _sntp_probe(self, host, timeout=2):
+        # RFC 5905 client packet, returns the local clock offset in seconds.
+        # The socket is unbound, so the kernel picks a random source port.
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(timeout)
+            t1 = time.time()
+            sock.sendto(b'\x1b' + 47 * b'\0', (self._resolve_ntp(host), 123))
+            buf, _ = sock.recvfrom(48)
+            t4 = time.time()
+        if len(buf) < 48:
+            raise ValueError('short SNTP reply')
+        if not 0 < buf[1] < 16:
+            raise ValueError('unsynchronized SNTP server')
+        sec, frac = struct.unpack('!II', buf[32:40])
+        t2 = sec - 2208988800 + frac / 2**32
+        sec, frac = struct.unpack('!II', buf[40:48])
+        t3 = sec - 2208988800 + frac / 2**32
+        return ((t2 - t1) + (t3 - t4)) / 2
+
     def sync_ntp(self):
+        # Retries come from every display wake-up until the first success, one at a time
+        if not self._ntp_lock.acquire(blocking=False):
+            return False
         try:
-            for server in self.config['ntp_servers']:
+            gateway, servers = self._effective_ntp_list()
+            for server in servers:
                 try:
-                    subprocess.check_call(['sudo', 'ntpdate', '-s', server], 
-                                        timeout=10, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                    offset = self._sntp_probe(server, timeout=0.5 if server == gateway else 2)
+                    if abs(offset) >= 1:
+                        subprocess.check_call(['sudo', 'ntpdate', '-s', server], 
+                                            timeout=10, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     self.last_ntp_sync = time.time()
+                    self._clock_synced = True
+                    try:
+                        self.ntp_sync_file.write_text(str(self.last_ntp_sync))
+                    except:
+                        pass
                     return True
                 except:
+                    self._ntp_ip_cache.pop(server, None)
                     continue
             return False
         except:
             return False
+        finally:
+            self._ntp_lock.release()
+
+    def read_temperature(self):
+        if self._temp_fd is not None:
+            try:
+                return int(os.pread(self._temp_fd, 16, 0)) / 1000.0
+            except (OSError, ValueError):
+                return None
+        try:
+            temps = psutil.sensors_temperatures()
+            if temps:
+                for name, entries in temps.items():
+                    if entries:
+                        return entries[0].current
+        except:
+            pass
+        return None
+
+    def _refresh_stats(self):
+        # One pass per tick, only over the sources the visible mode draws
+        mode = self.display_modes[self.current_mode]
+        stats = self._stats
+        now = time.monotonic()
+        try:
+            if mode == 'system_info':
+                stats.cpu = psutil.cpu_percent(interval=None)
+                stats.memory = psutil.virtual_memory()
+                if stats.disk is None or now - self._disk_ts >= 60:
+                    stats.disk = psutil.disk_usage('/')
+                    self._disk_ts = now
+            elif mode == 'network_info':
+                stats.net_io = psutil.net_io_counters()
+            elif mode == 'temperature':
+                stats.temp = self.read_temperature()
+            elif mode == 'uptime' and self._boot_mono is not None:
+                stats.uptime = now - self._boot_mono
+        except:
+            pass
 
     def get_system_info(self):
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            memory = self._stats.memory
+            disk = self._stats.disk
             return {
-                'cpu': cpu_percent,
+                'cpu': self._stats.cpu,
                 'memory_percent': memory.percent,
                 'memory_used': memory.used // (1024**2),
                 'memory_total': memory.total // (1024**2),
@@ -331,9 +600,12 @@ class NanoPiOLEDMonitor:
 
     def get_network_info(self):
         try:
-            result = subprocess.run(['hostname', '-I'], capture_output=True, text=True, timeout=5)
-            ip_addresses = result.stdout.strip().split()
-            net_io = psutil.net_io_counters()
+            cached_at, ip_addresses = self._net_cache
+            if ip_addresses is None or time.monotonic() - cached_at >= 30:
+                ip_addresses = [a.address for nic, addrs in psutil.net_if_addrs().items() if nic != 'lo'
+                                for a in addrs if a.family == socket.AF_INET]
+                self._net_cache = (time.monotonic(), ip_addresses)
+            net_io = self._stats.net_io
             return {
                 'ip_addresses': ip_addresses,
                 'bytes_sent': net_io.bytes_sent // (1024**2),
@@ -343,37 +615,34 @@ class NanoPiOLEDMonitor:
             return None
 
     def get_temperature(self):
-        try:
-            temp_files = ['/sys/class/thermal/thermal_zone0/temp', '/sys/class/hwmon/hwmon0/temp1_input']
-            for temp_file in temp_files:
-                try:
-                    with open(temp_file, 'r') as f:
-                        return int(f.read().strip()) / 1000.0
-                except:
-                    continue
-            try:
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    for name, entries in temps.items():
-                        if entries:
-                            return entries[0].current
-            except:
-                pass
-            return None
-        except:
-            return None
+        return self._stats.temp
 
     def get_uptime(self):
         try:
-            with open('/proc/uptime', 'r') as f:
-                uptime_seconds = float(f.readline().split()[0])
-            days = int(uptime_seconds // 86400)
-            hours = int((uptime_seconds % 86400) // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
+            days, rem = divmod(int(self._stats.uptime), 86400)
+            hours, rem = divmod(rem, 3600)
+            minutes = rem // 60
             return {'days': days, 'hours': hours, 'minutes': minutes}
         except:
             return None
 
+    def _label_tile(self, text):
+        tile = self._label_cache.get(text)
+        if tile is None:
+            scratch = Image.new('1', (128, 16))
+            ImageDraw.Draw(scratch).text((0, 0), text, fill="white", font=self.font)
+            bbox = scratch.getbbox() or (0, 0, 1, 1)
+            tile = (scratch.crop(bbox), bbox[:2], self.font.getlength(text))
+            self._label_cache[text] = tile
+        return tile
+
+    def label(self, draw, xy, text, value=None):
+        # Static text is rasterized once and pasted, only the value is drawn per frame
+        tile, (dx, dy), advance = self._label_tile(text)
+        self._frame.paste(tile, (xy[0] + dx, xy[1] + dy))
+        if value is not None:
+            draw.text((xy[0] + advance, xy[1]), value, fill="white", font=self.font)
+
     def draw_datetime(self, draw, width, height):
         try:
             now = datetime.now(self.timezone)
@@ -383,11 +652,10 @@ class NanoPiOLEDMonitor:
             
             draw.text((0, 0), date_str, fill="white")
             draw.text((0, 16), time_str, fill="white")
-            draw.text((0, 32), f"TZ: {tz_str}", fill="white")
+            self.label(draw, (0, 32), "TZ: ", tz_str)
             
-            time_since_sync = time.time() - self.last_ntp_sync
-            ntp_status = "Synced" if time_since_sync < 7200 else "Old"
-            draw.text((0, 48), f"NTP: {ntp_status}", fill="white")
+            ntp_status = "Synced" if self.ntp_fresh() else "Old"
+            self.label(draw, (0, 48), "NTP: ", ntp_status)
         except Exception as e:
             draw.text((0, 0), f"Time Error", fill="white")
 
@@ -395,13 +663,13 @@ class NanoPiOLEDMonitor:
         try:
             info = self.get_system_info()
             if not info:
-                draw.text((0, 0), "System info unavailable", fill="white")
+                self.label(draw, (0, 0), "System info unavailable")
                 return
             
-            draw.text((0, 0), f"CPU: {info['cpu']:.1f}%", fill="white")
-            draw.text((0, 12), f"RAM: {info['memory_percent']:.1f}%", fill="white")
+            self.label(draw, (0, 0), "CPU: ", f"{info['cpu']:.1f}%")
+            self.label(draw, (0, 12), "RAM: ", f"{info['memory_percent']:.1f}%")
             draw.text((0, 24), f"     {info['memory_used']}/{info['memory_total']}MB", fill="white")
-            draw.text((0, 36), f"Disk: {info['disk_percent']:.1f}%", fill="white")
+            self.label(draw, (0, 36), "Disk: ", f"{info['disk_percent']:.1f}%")
             draw.text((0, 48), f"      {info['disk_used']}/{info['disk_total']}GB", fill="white")
         except:
             draw.text((0, 0), "System Error", fill="white")
@@ -410,105 +678,175 @@ class NanoPiOLEDMonitor:
         try:
             info = self.get_network_info()
             if not info:
-                draw.text((0, 0), "Network unavailable", fill="white")
+                self.label(draw, (0, 0), "Network unavailable")
                 return
             
-            draw.text((0, 0), "Network Info", fill="white")
+            self.label(draw, (0, 0), "Network Info")
             y_pos = 12
             if info['ip_addresses']:
                 for ip in info['ip_addresses'][:2]:
-                    draw.text((0, y_pos), f"IP: {ip}", fill="white")
+                    self.label(draw, (0, y_pos), "IP: ", ip)
                     y_pos += 12
             else:
-                draw.text((0, y_pos), "No IP address", fill="white")
+                self.label(draw, (0, y_pos), "No IP address")
                 y_pos += 12
             
-            draw.text((0, y_pos), f"TX: {info['bytes_sent']}MB", fill="white")
-            draw.text((0, y_pos + 12), f"RX: {info['bytes_recv']}MB", fill="white")
+            self.label(draw, (0, y_pos), "TX: ", f"{info['bytes_sent']}MB")
+            self.label(draw, (0, y_pos + 12), "RX: ", f"{info['bytes_recv']}MB")
         except:
             draw.text((0, 0), "Network Error", fill="white")
 
     def draw_temperature(self, draw, width, height):
         try:
             temp = self.get_temperature()
-            draw.text((0, 0), "Temperature", fill="white")
+            self.label(draw, (0, 0), "Temperature")
             
             if temp is not None:
                 if self.config['temperature_unit'] == 'F':
                     temp_f = (temp * 9/5) + 32
-                    draw.text((0, 16), f"CPU: {temp_f:.1f}°F", fill="white")
+                    self.label(draw, (0, 16), "CPU: ", f"{temp_f:.1f}°F")
                     draw.text((0, 28), f"     {temp:.1f}°C", fill="white")
                 else:
-                    draw.text((0, 16), f"CPU: {temp:.1f}°C", fill="white")
+                    self.label(draw, (0, 16), "CPU: ", f"{temp:.1f}°C")
                 
                 status = "COOL" if temp < 50 else "WARM" if temp < 70 else "HOT!"
-                draw.text((0, 40), f"Status: {status}", fill="white")
+                self.label(draw, (0, 40), "Status: ", status)
             else:
-                draw.text((0, 16), "Sensor unavailable", fill="white")
+                self.label(draw, (0, 16), "Sensor unavailable")
         except:
             draw.text((0, 0), "Temp Error", fill="white")
 
     def draw_uptime(self, draw, width, height):
         try:
             uptime = self.get_uptime()
-            draw.text((0, 0), "System Uptime", fill="white")
+            self.label(draw, (0, 0), "System Uptime")
             
             if uptime:
-                draw.text((0, 16), f"Days: {uptime['days']}", fill="white")
-                draw.text((0, 28), f"Hours: {uptime['hours']}", fill="white")
-                draw.text((0, 40), f"Minutes: {uptime['minutes']}", fill="white")
+                self.label(draw, (0, 16), "Days: ", str(uptime['days']))
+                self.label(draw, (0, 28), "Hours: ", str(uptime['hours']))
+                self.label(draw, (0, 40), "Minutes: ", str(uptime['minutes']))
             else:
-                draw.text((0, 16), "Uptime unavailable", fill="white")
+                self.label(draw, (0, 16), "Uptime unavailable")
         except:
             draw.text((0, 0), "Uptime Error", fill="white")
 
+    def frame_pages(self, frame):
+        # One byte per column, LSB on top, as the SSD1306 stores each page
+        return [frame.crop((0, page * 8, 128, page * 8 + 8)).transpose(Image.ROTATE_270).tobytes()
+                for page in range(8)]
+
+    def push_frame(self, frame):
+        # Hashing 1 KB is far cheaper than splitting pages, skip unchanged frames outright
+        fb_hash = hashlib.blake2b(frame.tobytes(), digest_size=8).digest()
+        if fb_hash == self._last_fb_hash and self._prev_pages is not None:
+            return
+        pages = self.frame_pages(frame)
+        if self._prev_pages is None:
+            self.device.display(frame)
+        else:
+            for page, (new, old) in enumerate(zip(pages, self._prev_pages)):
+                if new == old:
+                    continue
+                changed = [x for x in range(128) if new[x] != old[x]]
+                self.device.command(0x21, changed[0], changed[-1], 0x22, page, page)
+                self.device.data(list(new[changed[0]:changed[-1] + 1]))
+        self._prev_pages = pages
+        self._last_fb_hash = fb_hash
+
     def update_display(self):
         try:
             with self.display_lock:
                 if not self.device:
                     return
                 
-                with canvas(self.device) as draw:
-                    mode = self.display_modes[self.current_mode]
-                    
-                    if mode == 'datetime':
-                        self.draw_datetime(draw, 128, 64)
-                    elif mode == 'system_info':
-                        self.draw_system_info(draw, 128, 64)
-                    elif mode == 'network_info':
-                        self.draw_network_info(draw, 128, 64)
-                    elif mode == 'temperature':
-                        self.draw_temperature(draw, 128, 64)
-                    elif mode == 'uptime':
-                        self.draw_uptime(draw, 128, 64)
+                frame = Image.new("1", (128, 64))
+                draw = ImageDraw.Draw(frame)
+                self._frame = frame
+                mode = self.display_modes[self.current_mode]
+                
+                if mode == 'datetime':
+                    self.draw_datetime(draw, 128, 64)
+                elif mode == 'system_info':
+                    self.draw_system_info(draw, 128, 64)
+                elif mode == 'network_info':
+                    self.draw_network_info(draw, 128, 64)
+                elif mode == 'temperature':
+                    self.draw_temperature(draw, 128, 64)
+                elif mode == 'uptime':
+                    self.draw_uptime(draw, 128, 64)
+                
+                self.push_frame(frame)
         except:
-            pass
+            self._prev_pages = None
 
     def auto_ntp_sync(self):
-        if time.time() - self.last_ntp_sync > self.ntp_sync_interval:
+        if not self.ntp_fresh():
             threading.Thread(target=self.sync_ntp, daemon=True).start()
 
+    def _view_key(self):
+        # Changes exactly when something on the visible screen would change
+        mode = self.display_modes[self.current_mode]
+        now = time.time()
+        if mode == 'datetime':
+            return int(now) if self.config['show_seconds'] else int(now // 60)
+        if mode == 'uptime' and self._boot_mono is not None:
+            return int((time.monotonic() - self._boot_mono) // 60)
+        return int(now // self.config['refresh_rate'])
+
+    def _view_period(self):
+        # Seconds between changes of _view_key() for the visible mode
+        mode = self.display_modes[self.current_mode]
+        if mode == 'datetime':
+            return 1 if self.config['show_seconds'] else 60
+        if mode == 'uptime' and self._boot_mono is not None:
+            return 60
+        return self.config['refresh_rate']
+
+    def _ticker(self):
+        last_key = None
+        while self.running:
+            try:
+                key = (self.current_mode, self._view_key())
+                if key != last_key:
+                    last_key = key
+                    self._redraw.set()
+            except:
+                pass
+            time.sleep(1.0 - time.time() % 1.0)
+
     def display_thread(self):
         while self.running:
             try:
+                self._redraw.wait(timeout=min(self._view_period(), self._watchdog_wait))
+                self._redraw.clear()
+                sd_notify('WATCHDOG=1')
                 self.auto_ntp_sync()
+                self._refresh_stats()
                 self.update_display()
-                time.sleep(self.config['refresh_rate'])
+                if time.monotonic() - self._config_flush_ts >= 30:
+                    self._flush_config()
             except:
                 time.sleep(5)
 
     def signal_handler(self, signum, frame):
         self.running = False
+        self._redraw.set()
 
     def run(self):
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
         
-        threading.Thread(target=self.sync_ntp, daemon=True).start()
+        self.auto_ntp_sync()
         
         display_thread = threading.Thread(target=self.display_thread)
         display_thread.daemon = True
         display_thread.start()
+        threading.Thread(target=self._ticker, daemon=True).start()
+        
+        if self._gpio_lines:
+            threading.Thread(target=self.gpio_thread, daemon=True).start()
+        
+        sd_notify('READY=1')
         
         try:
             while self.running:
@@ -520,13 +858,22 @@ class NanoPiOLEDMonitor:
 
     def cleanup(self):
         self.running = False
+        self._flush_config()
+        if self._temp_fd is not None:
+            try:
+                os.close(self._temp_fd)
+            except OSError:
+                pass
         try:
             if self.device:
                 self.device.cleanup()
         except:
             pass
         try:
-            GPIO.cleanup()
+            if self._gpio_lines:
+                self._gpio_lines.release()
+            elif GPIO is not None:
+                GPIO.cleanup()
         except:
             pass
 
@@ -538,18 +885,6 @@ EOF
 chmod +x "$APP_DIR/nanopi_oled_monitor.py"
 print_success "Application created"
 
-# Create wrapper script
-print_status "Creating launcher script..."
-cat > "$APP_DIR/run_monitor.sh" << EOF
-#!/bin/bash
-cd "$APP_DIR"
-source venv/bin/activate
-python nanopi_oled_monitor.py
-EOF
-
-chmod +x "$APP_DIR/run_monitor.sh"
-print_success "Launcher created"
-
 # Create systemd service
 print_status "Setting up auto-start service..."
 sudo tee /etc/systemd/system/nanopi-oled-monitor.service >/dev/null << EOF
@@ -559,11 +894,13 @@ After=network.target
 Wants=network.target
 
 [Service]
-Type=simple
+Type=notify
+NotifyAccess=main
+WatchdogSec=30
 User=$USER_NAME
 Group=$USER_NAME
 WorkingDirectory=$APP_DIR
-ExecStart=$APP_DIR/run_monitor.sh
+ExecStart=$APP_DIR/venv/bin/python $APP_DIR/nanopi_oled_monitor.py
 Restart=always
 RestartSec=10
 StandardOutput=journal